@@ -14,7 +14,7 @@ use sapio_base::serialization_helpers::SArc;
 use std::convert::TryFrom;
 /// The `Plugin` trait is used to provide bindings for a WASM Plugin.
 /// It's not intended to be used internally, just as bindings.
-pub trait Plugin: JsonSchema + Sized + for<'a> Deserialize<'a>
+pub trait Plugin: JsonSchema + Sized + for<'a> Deserialize<'a> + 'static
 where
     <<Self as client::plugin::Plugin>::ToType as std::convert::TryFrom<Self>>::Error:
         std::error::Error + 'static,
@@ -23,7 +23,9 @@ where
     type ToType: Compilable + TryFrom<Self>;
     /// gets the jsonschema for the plugin type, which is the API for calling create.
     fn get_api_inner() -> *mut c_char {
-        encode_json(&schemars::schema_for!(CreateArgs::<Self>))
+        // the schema is invariant per plugin type, so use the compiler's
+        // shared schema cache rather than re-deriving it on every call
+        encode_json(&*sapio::contract::macros::get_schema_for::<CreateArgs<Self>>())
     }
 
     /// creates an instance of the plugin from a json pointer and outputs a result pointer
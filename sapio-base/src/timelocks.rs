@@ -46,6 +46,7 @@ use type_tags::*;
 /// They are represented generically in the same type
 #[derive(JsonSchema, Serialize, Deserialize, Copy, Clone, PartialOrd, Ord, Eq, PartialEq)]
 #[serde(transparent)]
+#[repr(transparent)]
 pub struct LockTime<RelOrAbs: Absolutivity, HeightOrTime: TimeType>(
     u32,
     #[serde(skip)] PhantomData<(RelOrAbs, HeightOrTime)>,
@@ -92,6 +93,10 @@ mod alias {
     pub type AbsTime = LockTime<Abs, MTP>;
     pub const BIG_PAST_DATE: AbsTime = LockTime(1_600_000_000u32, PhantomData);
     pub const START_OF_TIME: AbsTime = LockTime(500_000_000, PhantomData);
+    /// A zero-length relative time delay, the default nSequence
+    pub const ZERO_DELAY: RelTime = LockTime(1 << 22, PhantomData);
+    /// Height zero, the default nLockTime
+    pub const NO_LOCKTIME: AbsHeight = LockTime(0, PhantomData);
 }
 pub use alias::*;
 
@@ -152,11 +157,13 @@ mod trait_impls {
         TT: TimeType,
     {
         fn from(lt: LockTime<A, TT>) -> Clause {
-            match (A::IS_ABSOLUTE, TT::IS_HEIGHT) {
-                (true, true) => Clause::After(lt.0),
-                (true, false) => Clause::After(lt.0),
-                (false, true) => Clause::Older(lt.0),
-                (false, false) => Clause::Older(lt.0),
+            // only absolutivity picks the clause; height vs time is encoded
+            // in the inner u32. The branch is a type-level constant, so each
+            // monomorphization compiles down to a single constructor.
+            if A::IS_ABSOLUTE {
+                Clause::After(lt.0)
+            } else {
+                Clause::Older(lt.0)
             }
         }
     }
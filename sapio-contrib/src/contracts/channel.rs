@@ -67,7 +67,10 @@ mod tests {
         };
         println!(
             "{}",
-            serde_json::to_string_pretty(&schemars::schema_for!(Channel<Stop, Args>)).unwrap()
+            serde_json::to_string_pretty(&*sapio::contract::macros::get_schema_for::<
+                Channel<Stop, Args>,
+            >())
+            .unwrap()
         );
         println!("{}", serde_json::to_string_pretty(&y).unwrap());
         let mut ctx = sapio::contract::Context::new(
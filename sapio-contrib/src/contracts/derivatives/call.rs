@@ -31,13 +31,15 @@ impl<'a> TryFrom<Call<'a>> for GenericBetArguments<'a> {
     fn try_from(mut v: Call<'a>) -> Result<Self, Self::Error> {
         let key = v.operator_api.get_key();
         let user = v.user_api.get_key();
-        let mut outcomes = vec![];
         let strike = v.strike_x_one_unit;
+        let strike_amount = Amount::from_sat(strike);
         let max_amount_bitcoin = v.amount * v.max_price_x_one_unit;
         // Increment 1 dollar per step
+        let steps = (strike..=v.max_price_x_one_unit).step_by(ONE_UNIT as usize);
+        let mut outcomes = Vec::with_capacity(steps.size_hint().0);
         let mut strike_ctx = v.ctx.derive_str(Arc::new("strike".into()))?;
-        for price in (strike..=v.max_price_x_one_unit).step_by(ONE_UNIT as usize) {
-            let mut profit = Amount::from_sat(price) - Amount::from_sat(strike);
+        for price in steps {
+            let mut profit = Amount::from_sat(price) - strike_amount;
             let mut refund = max_amount_bitcoin - profit;
             if v.buying {
                 std::mem::swap(&mut profit, &mut refund);
@@ -47,9 +47,11 @@ impl<'a> From<GenericBetArguments<'a>> for GenericBet {
             let r = v.oracle.get_key_lt_gte(&v.symbol, *k);
             h.insert(*k, r);
         }
+        let range = 0..v.outcomes.len();
         GenericBet {
             amount: v.amount,
-            outcomes: v.outcomes,
+            outcomes: Rc::new(v.outcomes),
+            range,
             oracle: Rc::new(h),
             cooperate: v.cooperate,
         }
@@ -60,36 +62,48 @@ impl<'a> From<GenericBetArguments<'a>> for GenericBet {
 /// oracle lookups and assembles a binary contract tree for the GenericBet
 pub struct GenericBet {
     amount: Amount,
-    outcomes: Vec<(i64, Template)>,
+    /// the full outcome schedule, shared by every node of the tree
+    outcomes: Rc<Vec<(i64, Template)>>,
+    /// the sub-range of `outcomes` this node covers
+    range: std::ops::Range<usize>,
     oracle: Rc<HashMap<i64, (Clause, Clause)>>,
     cooperate: Clause,
 }
 
 impl GenericBet {
+    /// this node's view of the outcome schedule
+    fn outcomes(&self) -> &[(i64, Template)] {
+        &self.outcomes[self.range.clone()]
+    }
     /// The oracle price kyes for this part of the tree is in the middle of the range.
     fn price(&self, b: bool) -> Clause {
-        let v = &self.oracle[&self.outcomes[self.outcomes.len() / 2].0];
+        let sl = self.outcomes();
+        let v = &self.oracle[&sl[sl.len() / 2].0];
         if b {
             v.1.clone()
         } else {
             v.0.clone()
         }
     }
+    /// recurse over a sub-range of this node's view, sharing the schedule
+    /// with the child rather than copying the slice
     fn recurse_over(
         &self,
         range: std::ops::Range<usize>,
         ctx: sapio::contract::Context,
     ) -> Result<Option<Template>, CompilationError> {
-        match &self.outcomes[range] {
+        let range = self.range.start + range.start..self.range.start + range.end;
+        match &self.outcomes[range.clone()] {
             [] => return Ok(None),
             [(_, a)] => Ok(Some(a.clone())),
-            sl => Ok(Some(
+            _ => Ok(Some(
                 ctx.template()
                     .add_output(
                         self.amount.into(),
                         &GenericBet {
                             amount: self.amount,
-                            outcomes: sl.into(),
+                            outcomes: self.outcomes.clone(),
+                            range,
                             oracle: self.oracle.clone(),
                             cooperate: self.cooperate.clone(),
                         },
@@ -106,7 +120,8 @@ impl GenericBet {
     }
     #[then(guarded_by = "[Self::gte]")]
     fn pay_gte(self, ctx: sapio::Context) {
-        if let Some(tmpl) = self.recurse_over(self.outcomes.len() / 2..self.outcomes.len(), ctx)? {
+        let n = self.range.len();
+        if let Some(tmpl) = self.recurse_over(n / 2..n, ctx)? {
             Ok(Box::new(std::iter::once(Ok(tmpl))))
         } else {
             Ok(Box::new(std::iter::empty()))
@@ -120,7 +135,7 @@ impl GenericBet {
     }
     #[then(guarded_by = "[Self::lt]")]
     fn pay_lt(self, ctx: sapio::Context) {
-        if let Some(tmpl) = self.recurse_over(0..self.outcomes.len() / 2, ctx)? {
+        if let Some(tmpl) = self.recurse_over(0..self.range.len() / 2, ctx)? {
             Ok(Box::new(std::iter::once(Ok(tmpl))))
         } else {
             Ok(Box::new(std::iter::empty()))
@@ -27,13 +27,15 @@ impl<'a> TryFrom<Put<'a>> for GenericBetArguments<'a> {
     fn try_from(mut v: Put<'a>) -> Result<Self, Self::Error> {
         let key = v.operator_api.get_key();
         let user = v.user_api.get_key();
-        let mut outcomes = vec![];
         let strike = v.strike_x_one_unit;
+        let strike_amount = Amount::from_sat(strike);
         let max_amount_bitcoin = v.amount * strike;
         // Increment 1 dollar per step
+        let steps = (0..=strike).step_by(ONE_UNIT as usize);
+        let mut outcomes = Vec::with_capacity(steps.size_hint().0);
         let mut strike_ctx = v.ctx.derive_str(Arc::new("strike".into()))?;
-        for price in (0..=strike).step_by(ONE_UNIT as usize) {
-            let mut profit = Amount::from_sat(strike) - Amount::from_sat(price);
+        for price in steps {
+            let mut profit = strike_amount - Amount::from_sat(price);
             let mut refund = max_amount_bitcoin - profit;
             if v.buying {
                 std::mem::swap(&mut profit, &mut refund);
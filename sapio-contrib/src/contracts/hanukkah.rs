@@ -32,10 +32,11 @@ pub struct Hanukkiah {
 }
 
 fn candles_left(s: u8) -> u8 {
-    if s == 8 {
-        return 0;
+    // sum of s..8, in closed form rather than by recursion
+    if s >= 8 {
+        0
     } else {
-        return s + candles_left(s + 1);
+        (s..8).sum()
     }
 }
 impl Hanukkiah {
@@ -51,13 +52,15 @@ impl Hanukkiah {
             })?;
             txn = txn.add_output(next_night.amount_range.max(), &next_night, None)?;
         }
-        for _ in 0..night {
-            txn = txn.add_output(
+        // every candle pays the same recipient, so wrap the address once
+        let recipient = Compiled::from_address(self.recipient.clone(), None);
+        txn = txn.add_outputs((0..night).map(|_| {
+            (
                 self.amount_per_candle.into(),
-                &Compiled::from_address(self.recipient.clone(), None),
+                &recipient as &dyn Compilable,
                 None,
-            )?;
-        }
+            )
+        }))?;
         let size = txn.estimate_tx_size();
         txn = txn.add_amount(self.feerate_per_byte * size);
         let candle_time =
@@ -137,14 +140,13 @@ impl Hanukkiah2Night {
     #[then]
     fn light_candles(self, ctx: Context) {
         let mut txn = ctx.template();
-        let mut r = self.recipients.clone();
+        // walk the recipients back-to-front without copying the whole list
+        let mut r = self.recipients.iter().rev();
         for _ in 0..self.night {
+            let recipient = r.next().ok_or(CompilationError::TerminateCompilation)?;
             txn = txn.add_output(
                 self.amount_per_candle.into(),
-                &Compiled::from_address(
-                    r.pop().ok_or(CompilationError::TerminateCompilation)?,
-                    None,
-                ),
+                &Compiled::from_address(recipient.clone(), None),
                 None,
             )?;
         }
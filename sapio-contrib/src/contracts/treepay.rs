@@ -5,12 +5,14 @@
 //  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 //! contracts for paying a large set of recipients fee efficiently
+use bitcoin::util::amount::Amount;
 use sapio::contract::*;
 use sapio::*;
 
 use schemars::*;
 use serde::*;
 use std::convert::TryInto;
+use std::sync::Arc;
 
 /// instructions to send an amount of coin to an address
 #[derive(JsonSchema, Serialize, Deserialize, Clone)]
@@ -33,35 +35,21 @@ pub struct TreePay {
 impl TreePay {
     #[then]
     fn expand(self, ctx: sapio::Context) {
-        let mut builder = ctx.template();
-        if self.participants.len() > self.radix {
-            for c in self
-                .participants
-                .chunks(self.participants.len() / self.radix)
-            {
-                let mut amt = bitcoin::util::amount::Amount::from_sat(0);
-                for Payment { amount, .. } in c {
-                    amt += amount.clone().try_into()?;
-                }
-                builder = builder.add_output(
-                    amt,
-                    &TreePay {
-                        participants: c.to_vec(),
-                        radix: self.radix,
-                    },
-                    None,
-                )?;
-            }
-        } else {
-            for Payment { amount, address } in self.participants.iter() {
-                builder = builder.add_output(
-                    (*amount).try_into()?,
-                    &Compiled::from_address(address.clone(), None),
-                    None,
-                )?;
-            }
+        // copy the participant list once so the whole expansion can share it,
+        // rather than copying every chunk at every level of the tree
+        let participants = Arc::new(self.participants.clone());
+        // prefix sums over the amounts, computed once, so that any chunk's
+        // total is a single subtraction at every level of the tree
+        let mut cumulative = Vec::with_capacity(participants.len() + 1);
+        let mut total = Amount::from_sat(0);
+        cumulative.push(total);
+        for Payment { amount, .. } in participants.iter() {
+            total += (*amount).try_into()?;
+            cumulative.push(total);
         }
-        builder.into()
+        let cumulative = Arc::new(cumulative);
+        let end = participants.len();
+        expand_slice(ctx, &participants, &cumulative, 0, end, self.radix)
     }
 }
 
@@ -69,3 +57,83 @@ impl Contract for TreePay {
     declare! {then, Self::expand}
     declare! {non updatable}
 }
+
+/// A view of a contiguous run of a `TreePay`'s participants. Used internally
+/// for the recursive expansion so that every node in the tree shares one
+/// participant list instead of owning a copy of its chunk.
+struct TreePaySlice {
+    /// the full participant list, shared by all nodes
+    participants: Arc<Vec<Payment>>,
+    /// prefix sums of the participant amounts, shared by all nodes;
+    /// cumulative[i] is the total of the first i payments
+    cumulative: Arc<Vec<Amount>>,
+    /// the start of this node's chunk
+    start: usize,
+    /// one past the end of this node's chunk
+    end: usize,
+    /// the radix to use
+    radix: usize,
+}
+
+impl TreePaySlice {
+    #[then]
+    fn expand(self, ctx: sapio::Context) {
+        expand_slice(
+            ctx,
+            &self.participants,
+            &self.cumulative,
+            self.start,
+            self.end,
+            self.radix,
+        )
+    }
+}
+
+impl Contract for TreePaySlice {
+    declare! {then, Self::expand}
+    declare! {non updatable}
+}
+
+fn expand_slice(
+    ctx: sapio::Context,
+    participants: &Arc<Vec<Payment>>,
+    cumulative: &Arc<Vec<Amount>>,
+    start: usize,
+    end: usize,
+    radix: usize,
+) -> TxTmplIt {
+    let mut builder = ctx.template();
+    let n = end - start;
+    if n > radix {
+        let chunk_size = n / radix;
+        let mut lo = start;
+        while lo < end {
+            let hi = end.min(lo + chunk_size);
+            let amt = cumulative[hi] - cumulative[lo];
+            builder = builder.add_output(
+                amt,
+                &TreePaySlice {
+                    participants: participants.clone(),
+                    cumulative: cumulative.clone(),
+                    start: lo,
+                    end: hi,
+                    radix,
+                },
+                None,
+            )?;
+            lo = hi;
+        }
+    } else {
+        // the amounts were converted and validated once when the prefix sums
+        // were built, so leaves read them back as adjacent differences;
+        // index both shared arrays directly with the same cursor
+        for i in start..end {
+            builder = builder.add_output(
+                cumulative[i + 1] - cumulative[i],
+                &Compiled::from_address(participants[i].address.clone(), None),
+                None,
+            )?;
+        }
+    }
+    builder.into()
+}
@@ -22,7 +22,8 @@ use std::sync::Arc;
 /// `mature`. At any time the remaining funds can be moved to `cold_storage`, which may vary based on the amount.
 pub struct Vault {
     cold_storage: Rc<dyn Fn(CoinAmount, Context) -> Result<Compiled, CompilationError>>,
-    hot_storage: bitcoin::Address,
+    /// the hot storage address, wrapped once so every step shares it
+    hot_storage: Compiled,
     n_steps: u64,
     amount_step: CoinAmount,
     timeout: AnyRelTimeLock,
@@ -32,34 +33,43 @@ pub struct Vault {
 impl Vault {
     #[then]
     fn step(self, ctx: sapio::Context) {
+        // pull the fields into locals up front; everything below reuses them
+        let Vault {
+            ref cold_storage,
+            ref hot_storage,
+            n_steps,
+            amount_step,
+            timeout,
+            mature,
+        } = *self;
         let mut ctx = ctx;
+        let step_amount: bitcoin::Amount = amount_step.try_into()?;
         let cold_storage_ctx = ctx.derive_str(Arc::new("cold".into()))?;
         let mut builder = ctx.template();
         builder = builder
             .add_output(
-                self.amount_step.try_into()?,
+                step_amount,
                 &UndoSendInternal {
-                    from_contract: (self.cold_storage)(self.amount_step, cold_storage_ctx)?,
-                    to_contract: Compiled::from_address(self.hot_storage.clone(), None),
-                    timeout: self.mature,
-                    amount: self.amount_step.into(),
+                    from_contract: (cold_storage)(amount_step, cold_storage_ctx)?,
+                    to_contract: hot_storage.clone(),
+                    timeout: mature,
+                    amount: amount_step.into(),
                 },
                 None,
             )?
-            .set_sequence(0, self.timeout)?;
+            .set_sequence(0, timeout)?;
 
-        if self.n_steps > 1 {
-            let sub_amount = bitcoin::Amount::try_from(self.amount_step)
-                .map_err(|_e| contract::CompilationError::TerminateCompilation)?
-                .checked_mul(self.n_steps - 1)
+        if n_steps > 1 {
+            let sub_amount = step_amount
+                .checked_mul(n_steps - 1)
                 .ok_or(contract::CompilationError::TerminateCompilation)?;
             let sub_vault = Vault {
-                cold_storage: self.cold_storage.clone(),
-                hot_storage: self.hot_storage.clone(),
-                n_steps: self.n_steps - 1,
-                amount_step: self.amount_step,
-                timeout: self.timeout,
-                mature: self.mature,
+                cold_storage: cold_storage.clone(),
+                hot_storage: hot_storage.clone(),
+                n_steps: n_steps - 1,
+                amount_step,
+                timeout,
+                mature,
             };
             builder.add_output(sub_amount, &sub_vault, None)?
         } else {
@@ -111,10 +121,13 @@ impl From<VaultAddress> for Vault {
     fn from(v: VaultAddress) -> Self {
         Vault {
             cold_storage: Rc::new({
-                let cs = v.cold_storage.clone();
-                move |_a, _ctx| Ok(Compiled::from_address(cs.clone(), None))
+                // The cold storage object is invariant over the recursive vault
+                // steps, so compile it to an address wrapper once up front
+                // rather than once per step.
+                let cs = Compiled::from_address(v.cold_storage.clone(), None);
+                move |_a, _ctx| Ok(cs.clone())
             }),
-            hot_storage: v.hot_storage,
+            hot_storage: Compiled::from_address(v.hot_storage, None),
             n_steps: v.n_steps,
             amount_step: v.amount_step,
             timeout: v.timeout,
@@ -178,7 +191,7 @@ impl TryFrom<VaultTree> for Vault {
                     })
                 }
             }),
-            hot_storage: v.hot_storage,
+            hot_storage: Compiled::from_address(v.hot_storage, None),
             n_steps: v.n_steps,
             amount_step: v.amount_step,
             timeout: v.timeout,
@@ -229,10 +229,7 @@ impl MenuBuilder {
     fn gen_menu(&self) -> Value {
         json!({
             "$schema": "http://json-schema.org/draft-07/schema#",
-            "oneOf": self.menu.iter().cloned().map(|x| {
-            x
-        }).collect::<Vec<RootSchema>>(),
-
+            "oneOf": &self.menu,
         })
     }
     fn open(&self) -> Reaction {
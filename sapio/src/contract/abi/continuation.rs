@@ -39,13 +39,14 @@ mod test {
     use sapio_base::effects::PathFragment;
     #[test]
     fn test_continuation_point_ser() -> Result<(), Box<dyn std::error::Error>> {
+        let schema = crate::contract::macros::get_schema_for::<ContinuationPoint>();
         let a: ContinuationPoint = ContinuationPoint::at(
-            Some(Arc::new(schemars::schema_for!(ContinuationPoint))),
+            Some(schema.clone()),
             EffectPath::push(None, PathFragment::Named(SArc(Arc::new("one".into())))),
         );
         let b: ContinuationPoint = serde_json::from_str(&format!(
             "{{\"schema\":{},\"path\":\"one\"}}",
-            serde_json::to_string(&schemars::schema_for!(ContinuationPoint))?
+            serde_json::to_string(&*schema)?
         ))?;
         assert_eq!(a, b);
         Ok(())
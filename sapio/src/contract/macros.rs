@@ -103,6 +103,20 @@ macro_rules! decl_then {
 lazy_static::lazy_static! {
 static ref SCHEMA_MAP: Mutex<HashMap<TypeId, Arc<RootSchema>>> =
 Mutex::new(HashMap::new());
+static ref NAME_MAP: Mutex<HashMap<&'static str, Arc<String>>> =
+Mutex::new(HashMap::new());
+}
+/// `get_name_for` returns a shared Arc<String> for a static function name.
+/// The names are fixed at definition time by the contract macros, so interning
+/// them avoids a fresh allocation every time a pathway is assembled during
+/// compilation.
+pub fn get_name_for(name: &'static str) -> Arc<String> {
+    NAME_MAP
+        .lock()
+        .unwrap()
+        .entry(name)
+        .or_insert_with(|| Arc::new(name.into()))
+        .clone()
 }
 /// `get_schema_for` returns a cached RootSchema for a given type.  this is
 /// useful because we might expect to generate the same RootSchema many times,
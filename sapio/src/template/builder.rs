@@ -16,7 +16,6 @@ use sapio_base::effects::PathFragment;
 use sapio_base::timelocks::*;
 use sapio_base::CTVHash;
 use sapio_base::Clause;
-use std::convert::TryFrom;
 use std::convert::TryInto;
 
 /// Builder can be used to interactively put together a transaction template before
@@ -89,6 +88,24 @@ impl Builder {
         Ok(ret)
     }
 
+    /// Adds a sequence of Outputs in order, stopping at the first error.
+    /// Equivalent to folding `add_output` over the iterator.
+    pub fn add_outputs<'a, I>(mut self, outputs: I) -> Result<Self, CompilationError>
+    where
+        I: IntoIterator<
+            Item = (
+                Amount,
+                &'a dyn crate::contract::Compilable,
+                Option<OutputMeta>,
+            ),
+        >,
+    {
+        for (amount, contract, metadata) in outputs {
+            self = self.add_output(amount, contract, metadata)?;
+        }
+        Ok(self)
+    }
+
     /// adds available funds to the builder's context object.
     /// TODO: Make guarantee there is some external input?
     pub fn add_amount(mut self, a: Amount) -> Self {
@@ -187,8 +204,8 @@ impl Builder {
     /// Creates a transaction from a Builder.
     /// Generally, should not be called directly.
     pub fn get_tx(&self) -> bitcoin::Transaction {
-        let default_seq = RelTime::try_from(0).unwrap().into();
-        let default_nlt = AbsHeight::try_from(0).unwrap().into();
+        let default_seq = ZERO_DELAY.into();
+        let default_nlt = NO_LOCKTIME.into();
         bitcoin::Transaction {
             version: self.version,
             lock_time: self.lock_time.unwrap_or(default_nlt).get(),
@@ -148,7 +148,7 @@ pub fn then(args: TokenStream, input: TokenStream) -> TokenStream {
                     guard: &#gba,
                     conditional_compile_if: &#cia,
                     func: Self::#then_fn_name,
-                    name: std::sync::Arc::new(std::stringify!(#name).into()),
+                    name: sapio::contract::macros::get_name_for(std::stringify!(#name)),
                 })
             }
             /// (missing docs fix)
@@ -278,7 +278,7 @@ pub fn continuation(args: TokenStream, input: TokenStream) -> TokenStream {
                     conditional_compile_if: &#cia,
                     func: Self::#continue_name,
                     schema: Self::#continue_schema_for_name.map(|f|f()),
-                    name: std::sync::Arc::new(std::stringify!(#name).into()),
+                    name: sapio::contract::macros::get_name_for(std::stringify!(#name)),
                     f: std::default::Default::default()
                 };
                 Some(Box::new(f))